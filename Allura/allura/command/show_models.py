@@ -73,6 +73,9 @@ class ReindexCommand(base.Command):
         help='Skip clearing solr index.')
     parser.add_option('--refs', action='store_true', dest='refs',
                       help='Update artifact references and shortlinks')
+    parser.add_option('--ignore-fingerprints', action='store_true', dest='ignore_fingerprints',
+                      help='With --skip-solr-delete, send artifacts to solr even if they have not changed since '
+                           'they were last indexed')
     parser.add_option('--tasks', action='store_true', dest='tasks',
                       help='Run each individual index operation as a background task.  '
                            'Note: this is often better, since tasks have "request" objects '
@@ -152,7 +155,8 @@ def command(self):
 
     @property
     def add_artifact_kwargs(self):
-        kwargs = {}
+        # unless the solr docs are kept, there's nothing to compare against
+        kwargs = dict(skip_unchanged=bool(self.options.skip_solr_delete and not self.options.ignore_fingerprints))
         if self.options.solr_hosts:
             kwargs['solr_hosts'] = self.options.solr_hosts.split(',')
         if self.options.solr_creds:
@@ -17,6 +17,8 @@
 
 
 import ast
+import hashlib
+import json
 import re
 from logging import getLogger
 
@@ -87,8 +89,14 @@ def should_update_index(self, old_doc, new_doc):
         """
         return old_doc != new_doc
 
-    def solarize(self):
-        doc = self.index()
+    def solarize(self, doc=None):
+        """
+        Return the :meth:`index` doc, converted for sending to solr.
+
+        :param doc: an already computed :meth:`index` doc, which will be modified in place
+        """
+        if doc is None:
+            doc = self.index()
         if doc is None:
             return None
         # if index() returned doc without text, assume empty text
@@ -135,6 +143,19 @@ def translate_query(cls, q, fields):
         return q
 
 
+def index_fingerprint(doc):
+    """
+    Return a hash of a :meth:`SearchIndexable.index` doc, to tell whether it changed since it was last
+    sent to solr, without having to :meth:`~SearchIndexable.solarize` it.
+
+    Returns None if the text has macros whose output can change even when the doc doesn't.
+    """
+    if g.markdown.uncacheable_macro_regex.search(doc.get('text') or ''):
+        return None
+    data = json.dumps(doc, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
 class SearchError(SolrError):
     pass
 
@@ -18,6 +18,8 @@
 
 import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from itertools import zip_longest
 from collections.abc import Iterable
 
@@ -107,20 +109,24 @@ def __init__(self, push_servers: Iterable[str], query_server: str | None = None,
         self.commitWithin = commitWithin
 
     def add(self, *args, **kw):
+        responses = []
+        for solr in self.push_pool:
+            responses.append(self.add_to(solr, *args, **kw))
+        return responses
+
+    def add_to(self, solr: pysolr.Solr, *args, **kw):
+        """Add to a single server from `push_pool`"""
         if 'commit' not in kw:
             kw['commit'] = self._commit
         if self.commitWithin and 'commitWithin' not in kw:
             kw['commitWithin'] = self.commitWithin
-        responses = []
-        for solr in self.push_pool:
-            try:
-                responses.append(solr.add(*args, **kw))
-            except SolrError as e:
-                if '(HTTP 413)' in str(e):
-                    raise HTTPRequestEntityTooLarge() from e
-                else:
-                    raise
-        return responses
+        try:
+            return solr.add(*args, **kw)
+        except SolrError as e:
+            if '(HTTP 413)' in str(e):
+                raise HTTPRequestEntityTooLarge() from e
+            else:
+                raise
 
     def delete(self, *args, **kw):
         if 'commit' not in kw:
@@ -140,6 +146,97 @@ def search(self, *args, **kw):
         return self.query_server.search(*args, **kw)
 
 
+class SolrPusher:
+
+    """Pushes documents to solr in size-bounded batches from background threads.
+
+    Documents are buffered with :meth:`add` until a batch reaches `batch_bytes`, then
+    the batch is sent to every push server concurrently, while the caller goes on
+    producing documents.  At most `max_in_flight` batches are outstanding; beyond
+    that :meth:`add` blocks until the oldest one is done.
+
+    A batch rejected as too large is split in half and retried, down to a single
+    document.  Errors are raised from :meth:`close` once all batches are done.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(self, solr: Solr | MockSOLR, batch_bytes: int | None = None, max_in_flight: int | None = None):
+        if batch_bytes is None:
+            batch_bytes = int(config.get('solr.push.batch_bytes', 5 * 1024 * 1024))
+        if max_in_flight is None:
+            max_in_flight = int(config.get('solr.push.max_in_flight', 2))
+        self.batch_bytes = batch_bytes
+        self.max_in_flight = max(1, max_in_flight)
+        if isinstance(solr, Solr):
+            self.targets = [(lambda docs, server=server: solr.add_to(server, docs))
+                            for server in solr.push_pool]
+        else:
+            self.targets = [solr.add]
+        self.executor = ThreadPoolExecutor(max_workers=self.max_in_flight * len(self.targets),
+                                           thread_name_prefix='solr-push')
+        self.in_flight = deque()
+        self.errors = []
+        self.batch = []
+        self.batch_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.close(raise_errors=False)
+
+    def add(self, doc: dict):
+        size = len(json.dumps(doc, default=str))
+        if self.batch and self.batch_size + size > self.batch_bytes:
+            self.flush()
+        self.batch.append(doc)
+        self.batch_size += size
+
+    def flush(self):
+        if not self.batch:
+            return
+        while len(self.in_flight) >= self.max_in_flight:
+            self._wait_oldest()
+        batch = self.batch
+        self.batch = []
+        self.batch_size = 0
+        self.in_flight.append([self.executor.submit(self._push, target, batch)
+                               for target in self.targets])
+
+    def close(self, raise_errors=True):
+        try:
+            self.flush()
+            while self.in_flight:
+                self._wait_oldest()
+        finally:
+            self.executor.shutdown()
+        if raise_errors and self.errors:
+            raise self.errors[0]
+
+    def _wait_oldest(self):
+        futures = self.in_flight.popleft()
+        wait(futures)
+        for f in futures:
+            if f.exception() is not None:
+                self.errors.append(f.exception())
+
+    def _push(self, target, docs: list):
+        try:
+            target(docs)
+        except HTTPRequestEntityTooLarge:
+            if len(docs) > 1:
+                log.warning(f"Solr.add raised HTTPRequestEntityTooLarge. Splitting {len(docs)} updates into two batches.")
+                self._push(target, docs[:len(docs) // 2])
+                self._push(target, docs[len(docs) // 2:])
+            else:
+                log.info(f"Solr.add raised HTTPRequestEntityTooLarge but there is only one document ({docs[0].get('id')}). Raising exception.")
+                raise
+
+
 class MockSOLR:
 
     class MockHits(list):
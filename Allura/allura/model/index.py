@@ -38,7 +38,7 @@
 from allura.lib import helpers as h
 
 from .session import main_orm_session
-from .project import Project
+from .project import Project, AppConfig
 
 if typing.TYPE_CHECKING:
     from ming.odm.mapper import Query
@@ -93,6 +93,8 @@ class __mongometa__:
         artifact_id=S.Anything(if_missing=None),
     ))
     references = FieldProperty([str])
+    # see allura.lib.search.index_fingerprint
+    solr_fingerprint = FieldProperty(str, if_missing=None)
 
     @classmethod
     def from_artifact(cls, artifact):
@@ -126,6 +128,62 @@ def artifact(self):
             log.exception('Error loading artifact for %s: %r',
                           self._id, aref)
 
+    @classmethod
+    def artifacts_from_refs(cls, refs):
+        '''Bulk version of :attr:`artifact`.
+
+        Groups the references by artifact class and loads each class with a
+        single ``$in`` query.  The projects and app configs the artifacts belong
+        to are loaded the same way, so that later ``artifact.project`` and
+        ``artifact.app_config`` lookups are served from the identity map.
+
+        Each ref's :attr:`artifact` is primed with the result too.
+
+        :param refs: ArtifactReference instances
+        :return: artifacts keyed by ArtifactReference ``_id`` (``None`` if not found)
+        :rtype: dict
+        '''
+        refs = list(refs)
+        result = {}
+        refs_by_cls = defaultdict(list)
+        project_ids = set()
+        app_config_ids = set()
+        for ref in refs:
+            aref = ref.artifact_reference
+            result[ref._id] = None
+            try:
+                refs_by_cls[_load_cls(aref.cls)].append(ref)
+            except Exception:
+                log.exception('Error loading artifact for %s: %r',
+                              ref._id, aref)
+                continue
+            if aref.project_id:
+                project_ids.add(aref.project_id)
+            if aref.app_config_id:
+                app_config_ids.add(aref.app_config_id)
+
+        if project_ids:
+            Project.query.find(dict(_id={'$in': list(project_ids)})).all()
+        if app_config_ids:
+            AppConfig.query.find(dict(_id={'$in': list(app_config_ids)})).all()
+
+        for artifact_cls, cls_refs in refs_by_cls.items():
+            artifact_ids = [ref.artifact_reference.artifact_id for ref in cls_refs]
+            try:
+                artifacts = artifact_cls.query.find(dict(_id={'$in': artifact_ids})).all()
+            except Exception:
+                log.exception('Error loading %s artifacts for %s',
+                              artifact_cls.__name__, [ref._id for ref in cls_refs])
+                continue
+            artifacts_by_id = {a._id: a for a in artifacts}
+            for ref in cls_refs:
+                result[ref._id] = artifacts_by_id.get(ref.artifact_reference.artifact_id)
+
+        for ref in refs:
+            # prime the LazyProperty
+            ref.__dict__['artifact'] = result[ref._id]
+        return result
+
 
 class Shortlink(MappedClass):
     '''Collection mapping shorthand_ids for artifacts to ArtifactReferences'''
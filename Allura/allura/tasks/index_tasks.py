@@ -19,8 +19,7 @@
 import sys
 import logging
 from collections.abc import Iterable
-from contextlib import contextmanager
-import typing
+from contextlib import contextmanager, nullcontext
 
 from tg import app_globals as g
 from tg import tmpl_context as c
@@ -29,11 +28,7 @@
 from allura.lib import helpers as h
 from allura.lib.decorators import task
 from allura.lib.exceptions import CompoundError
-from allura.lib.solr import make_solr_from_config
-
-if typing.TYPE_CHECKING:
-    import pysolr
-
+from allura.lib.solr import make_solr_from_config, SolrPusher
 
 log = logging.getLogger(__name__)
 
@@ -108,59 +103,69 @@ def del_users(user_solr_ids):
 def add_artifacts(ref_ids, update_solr=True, update_refs=True,
                   solr_hosts: Iterable[str] = (),
                   solr_creds: Iterable[tuple[str, str]] = (),
+                  skip_unchanged=True,
                   ):
     '''
     Add the referenced artifacts to SOLR and shortlinks.
+
+    :param skip_unchanged: don't send artifacts to SOLR if their index doc hasn't changed since they were last sent
     '''
     from allura import model as M
-    from allura.lib.search import find_shortlinks
+    from allura.lib.search import find_shortlinks, index_fingerprint
 
     # task params end up as instrumented lists, need to make this a list of plain tuples
     solr_creds = [tuple(cred) for cred in solr_creds]
 
     exceptions = []
-    solr_updates = []
-    with _indexing_disabled(M.session.artifact_orm_session._get()):
-        for ref in M.ArtifactReference.query.find(dict(_id={'$in': ref_ids})):
+    fingerprints = []
+    solr_pusher = SolrPusher(__get_solr(solr_hosts, solr_creds)) if update_solr else nullcontext()
+    with _indexing_disabled(M.session.artifact_orm_session._get()), solr_pusher:
+        refs = M.ArtifactReference.query.find(dict(_id={'$in': ref_ids})).all()
+        artifacts = M.ArtifactReference.artifacts_from_refs(refs)
+        apps_by_config_id = {}
+        for ref in refs:
             try:
-                artifact = ref.artifact
+                artifact = artifacts[ref._id]
                 if artifact is None:
                     continue
                 # c.project and .app are normally set, so keep using them
                 # During a reindex or other batch jobs, they are not though, so set it from artifact
-                app = getattr(c, 'app', None) or artifact.app
+                app = getattr(c, 'app', None)
+                if not app:
+                    # instantiating an Application isn't free, so reuse them across the batch
+                    app_config_id = getattr(artifact, 'app_config_id', None)
+                    if app_config_id not in apps_by_config_id:
+                        app = artifact.app
+                        if app_config_id is not None:
+                            apps_by_config_id[app_config_id] = app
+                    else:
+                        app = apps_by_config_id[app_config_id]
                 project = getattr(c, 'project', None) or artifact.project
                 with h.push_config(c, project=project, app=app):
-                    s = artifact.solarize()
-                    if s is None:
+                    doc = artifact.index()
+                    if doc is None:
                         continue
+                    # Find shortlinks in the raw text, not the escaped html
+                    # created by the `solarize()`.
+                    link_text = doc.get('text') or ''
                     if update_solr:
-                        solr_updates.append(s)
+                        fingerprint = index_fingerprint(doc)
+                        if not (skip_unchanged and fingerprint and fingerprint == ref.solr_fingerprint):
+                            # sent in batches from other threads while we go on rendering
+                            solr_pusher.add(artifact.solarize(doc))
+                            fingerprints.append((ref, fingerprint))
                     if update_refs:
                         if isinstance(artifact, M.Snapshot):
                             continue
-                        # Find shortlinks in the raw text, not the escaped html
-                        # created by the `solarize()`.
-                        link_text = artifact.index().get('text') or ''
                         shortlinks = find_shortlinks(link_text)
                         ref.references = [link.ref_id for link in shortlinks]
             except Exception:
                 log.error('Error indexing artifact %s', ref._id)
                 exceptions.append(sys.exc_info())
 
-        def _add_artifact(solr: pysolr.Solr, artifacts: list):
-            try:
-                solr.add(artifacts)
-            except HTTPRequestEntityTooLarge:
-                if len(artifacts) > 1:
-                    log.warning(f"Solr.add raised HTTPRequestEntityTooLarge. Splitting {len(artifacts)} updates into two batches.")
-                    _add_artifact(solr, artifacts[:len(artifacts) // 2])
-                    _add_artifact(solr, artifacts[len(artifacts) // 2:])
-                else:
-                    log.info("Solr.add raised HTTPRequestEntityTooLarge but there is only one artifact. Raising exception.")
-                    raise
-
-        _add_artifact(__get_solr(solr_hosts, solr_creds), solr_updates)
+    # only record these once solr has them
+    for ref, fingerprint in fingerprints:
+        ref.solr_fingerprint = fingerprint
 
     if len(exceptions) == 1:
         raise exceptions[0][1].with_traceback(exceptions[0][2])
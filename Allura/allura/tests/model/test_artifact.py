@@ -133,6 +133,27 @@ def test_artifactlink(self):
         assert not M.Shortlink.lookup('[wiki:TestPage2]')
         assert q_shortlink.count() == 0
 
+    def test_artifacts_from_refs(self):
+        pages = [WM.Page(title='TestPage%d' % i) for i in range(3)]
+        msg = Checkmessage(text='hi')
+        ThreadLocalODMSession.flush_all()
+        refs = [M.ArtifactReference.from_artifact(a) for a in pages + [msg]]
+        missing = M.ArtifactReference.from_artifact(WM.Page(title='Gone'))
+        ThreadLocalODMSession.flush_all()
+        WM.Page.query.remove(dict(title='Gone'))
+        ThreadLocalODMSession.close_all()
+
+        refs = M.ArtifactReference.query.find(dict(_id={'$in': [r._id for r in refs + [missing]]})).all()
+        with patch.object(WM.Page.query, 'get') as page_get:
+            result = M.ArtifactReference.artifacts_from_refs(refs)
+            assert result[missing._id] is None
+            assert {result[p.index_id()].title for p in pages} == {'TestPage0', 'TestPage1', 'TestPage2'}
+            assert result[msg.index_id()].text == 'hi'
+            # primed, so no per-ref lookups
+            for ref in refs:
+                assert ref.artifact is result[ref._id]
+            assert not page_get.called
+
     def test_gen_messageid(self):
         assert re.match(r'[0-9a-zA-Z]*.wiki@test.p.localhost',
                         h.gen_message_id())
@@ -522,6 +522,15 @@ def test_solr_hosts_list(self, Solr):
             {'http://blah.com/solr/forge',
              'https://other.net/solr/forge'})
 
+    def test_skip_unchanged(self):
+        cmd = show_models.ReindexCommand('reindex')
+        cmd.options, args = cmd.parser.parse_args(['--solr'])
+        assert cmd.add_artifact_kwargs['skip_unchanged'] is False
+        cmd.options, args = cmd.parser.parse_args(['--solr', '--skip-solr-delete'])
+        assert cmd.add_artifact_kwargs['skip_unchanged'] is True
+        cmd.options, args = cmd.parser.parse_args(['--solr', '--skip-solr-delete', '--ignore-fingerprints'])
+        assert cmd.add_artifact_kwargs['skip_unchanged'] is False
+
     @patch('allura.command.show_models.utils')
     def test_project_regex(self, utils):
         cmd = show_models.ReindexCommand('reindex')
@@ -555,7 +564,8 @@ def on_post(chunk, **kw):
         cmd = show_models.ReindexCommand('reindex')
         cmd.options, args = cmd.parser.parse_args([])
         cmd._post_add_artifacts(list(range(5)))
-        kw = {'update_solr': cmd.options.solr, 'update_refs': cmd.options.refs, '__task_priority': 5}
+        kw = {'update_solr': cmd.options.solr, 'update_refs': cmd.options.refs, '__task_priority': 5,
+              'skip_unchanged': False}
         expected = [
             call([0, 1, 2, 3, 4], **kw),
             call([0, 1], **kw),
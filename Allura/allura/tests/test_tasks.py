@@ -214,6 +214,31 @@ def test_add_artifacts(self):
             assert (find_slinks.call_args_list ==
                     [mock.call(a.index().get('text')) for a in artifacts])
 
+    @td.with_wiki
+    def test_add_artifacts_skip_unchanged(self):
+        artifacts = [_TestArtifact(_shorthand_id='tu_%s' % x, text='text %s' % x)
+                     for x in range(3)]
+        M.artifact_orm_session.flush()
+        ref_ids = [M.ArtifactReference.from_artifact(a)._id for a in artifacts]
+        index_tasks.add_artifacts(ref_ids, update_refs=False)
+        M.main_orm_session.flush()
+        M.main_orm_session.clear()
+        assert all(ref.solr_fingerprint for ref in M.ArtifactReference.query.find(dict(_id={'$in': ref_ids})))
+
+        with mock.patch('allura.tasks.index_tasks.g.solr') as solr:
+            index_tasks.add_artifacts(ref_ids, update_refs=False)
+            assert not solr.add.called
+
+            artifact = _TestArtifact.query.get(_shorthand_id='tu_1')
+            artifact.text = 'changed'
+            M.artifact_orm_session.flush()
+            index_tasks.add_artifacts(ref_ids, update_refs=False)
+            assert [doc['id'] for doc in solr.add.call_args[0][0]] == [artifact.index_id()]
+
+            solr.reset_mock()
+            index_tasks.add_artifacts(ref_ids, update_refs=False, skip_unchanged=False)
+            assert len(solr.add.call_args[0][0]) == 3
+
     @td.with_wiki
     @mock.patch('allura.tasks.index_tasks.g.solr')
     def test_del_artifacts(self, solr):
@@ -25,7 +25,7 @@
 from allura.lib import helpers as h
 from allura.tests import decorators as td
 from alluratest.controller import setup_basic_test
-from allura.lib.solr import Solr, escape_solr_arg
+from allura.lib.solr import Solr, SolrPusher, escape_solr_arg
 from allura.lib.search import search, search_app, SearchIndexable, strip_local_params
 
 
@@ -108,6 +108,40 @@ def test_search(self, pysolr):
         solr.search('bar', kw='kw')
         solr.query_server.search.assert_called_once_with('bar', kw='kw')
 
+    def test_pusher_batches(self):
+        solr = mock.Mock(spec=['add'])
+        docs = [{'id': str(i), 'text': 'x' * 50} for i in range(10)]
+        with SolrPusher(solr, batch_bytes=200, max_in_flight=2) as pusher:
+            for doc in docs:
+                pusher.add(doc)
+        batches = [call.args[0] for call in solr.add.call_args_list]
+        assert len(batches) == 5
+        assert sorted((d for b in batches for d in b), key=lambda d: int(d['id'])) == docs
+
+    @mock.patch('allura.lib.solr.pysolr')
+    def test_pusher_each_server(self, pysolr):
+        solr = Solr(['server1', 'server2'], commit=False, commitWithin='10000')
+        with SolrPusher(solr) as pusher:
+            pusher.add({'id': '1'})
+        calls = [mock.call([{'id': '1'}], commit=False, commitWithin='10000')] * 2
+        pysolr.Solr().add.assert_has_calls(calls)
+
+    def test_pusher_too_big(self):
+        def add(docs):
+            if len(docs) > 1:
+                raise HTTPRequestEntityTooLarge()
+        solr = mock.Mock(spec=['add'])
+        solr.add.side_effect = add
+        with SolrPusher(solr) as pusher:
+            for i in range(4):
+                pusher.add({'id': str(i)})
+        assert solr.add.call_count == 7
+
+        solr.add.side_effect = HTTPRequestEntityTooLarge()
+        with pytest.raises(HTTPRequestEntityTooLarge):
+            with SolrPusher(solr) as pusher:
+                pusher.add({'id': 'huge'})
+
     @mock.patch('allura.lib.search.search')
     def test_site_admin_search(self, search):
         from allura.lib.search import site_admin_search